@@ -1,6 +1,8 @@
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-import pandas as ps
+import xlsxwriter
 import csv
 
 from services import *
@@ -8,10 +10,15 @@ from services import *
 global data_headers
 
 
+@lru_cache(maxsize=None)
 def get_all_subclasses(cls):
     """Gets all leaves in the class tree starting
     from the specified class.
 
+    The class tree is fixed once the services module is imported,
+    so results are memoised rather than re-walking __subclasses__
+    on every call.
+
     Args:
         cls (Class):                    Any class.
 
@@ -31,35 +38,30 @@ def get_all_subclasses(cls):
 
 def setup(keys_csv_path: str) -> None:
     """Applies supplied access keys to service classes and
-    defines dict for storing data to write.
+    defines the headers for the records to write.
 
     Args:
         keys_csv_path (str): path to csv containing access keys.
     """
 
-    global data
     global data_headers
-
-    aws_access_key_id = ""
-    aws_secret_access_key = ""
-    aws_session_token = ""
+    global data_header_indices
 
     with open(keys_csv_path, "r") as keys_file:
-        reader = csv.reader(keys_file)
-        keys_data = list(reader)[1]
+        reader = csv.DictReader(keys_file)
+        keys_data = next(reader)
+
+    ##Column names as IAM writes them in its access key csv download
 
-    if len(keys_data) == 2:
-        aws_access_key_id = keys_data[0]
-        aws_secret_access_key = keys_data[1]
-    elif len(keys_data) == 3:
-        aws_session_token = keys_data[2]
+    aws_access_key_id = keys_data.get("Access key ID", "")
+    aws_secret_access_key = keys_data.get("Secret access key", "")
+    aws_session_token = keys_data.get("Session token", "")
 
     Service.set_keys(aws_access_key_id, aws_secret_access_key, aws_session_token)
 
     [subclass.set_client() for subclass in get_all_subclasses(GlobalService)]
 
     EC2.set_client(region=None)
-    EC2.set_resource()
 
     ##Only add headers that are to be manually added in the main script
 
@@ -71,18 +73,56 @@ def setup(keys_csv_path: str) -> None:
         [subclass.__name__ for subclass in get_all_subclasses(RegionalService)]
     )
 
-    data = {header: [] for header in data_headers}
+    ##Header name to record index lookup, built once so records don't
+    ##need a linear data_headers.index scan per field
+
+    data_header_indices = {header: index for index, header in enumerate(data_headers)}
 
     return
 
 
-def get_associations(region: str) -> None:
-    """Main loop of the tool, takes a region
-    and write all services for all sercurity groups
-    in that region to the main 'data' dict.
+def get_security_group_record(
+    security_group: dict, regional_service_types_to_lookup: set, region: str
+) -> list[str]:
+    """Builds the output record for a single security group by asking
+    each of the given service types for its service names.
+
+    Safe to run from worker threads once clients are set and
+    non-lookupable service caches are loaded, as it only issues
+    read-only boto3 calls and dict lookups.
+
+    Args:
+        security_group (dict):                  dict of information from boto3 about a security group
+        regional_service_types_to_lookup (set): RegionalService types present in the group's network interfaces
+        region (str):                           region name
+
+    Returns:
+        list[str]: record of fields in data_headers order
+    """
+
+    new_record = [""] * len(data_headers)
+
+    new_record[0] = security_group["GroupId"]
+    new_record[1] = security_group["GroupName"]
+    new_record[2] = region
+
+    for regional_service in regional_service_types_to_lookup:
+        new_record[data_header_indices[regional_service.__name__]] = "\n".join(
+            regional_service.get_service_names_in_security_group(security_group)
+        )
+
+    return new_record
+
+
+def get_associations(region: str) -> list[list[str]]:
+    """Main loop of the tool, takes a region and builds a record
+    of associated services for every sercurity group in that region.
 
     Args:
         region (str): region name
+
+    Returns:
+        list[list[str]]: records of fields in data_headers order
     """
 
     EC2.set_client(region)
@@ -96,35 +136,63 @@ def get_associations(region: str) -> None:
     #     }
     # ]
 
-    for security_group in security_groups:
-
-        new_record = [""] * len(data.keys())
+    network_interfaces_by_security_group_id = (
+        EC2.get_network_interfaces_by_security_group_id(
+            [security_group["GroupId"] for security_group in security_groups]
+        )
+    )
 
-        new_record[0] = security_group["GroupId"]
-        new_record[1] = security_group["GroupName"]
-        new_record[2] = region
+    ##Classify each network interface exactly once, then union the
+    ##results per security group; an interface shared by many groups
+    ##used to be re-scanned for each of them
 
-        network_interfaces = EC2.get_network_interfaces_for_security_group(
-            security_group
+    service_types_by_interface_id = {
+        network_interface["NetworkInterfaceId"]: (
+            EC2.get_service_types_from_network_interfaces([network_interface])
         )
-
-        regional_service_types_to_lookup = (
-            EC2.get_service_types_from_network_interfaces(network_interfaces)
+        for network_interfaces in network_interfaces_by_security_group_id.values()
+        for network_interface in network_interfaces
+    }
+
+    service_types_by_security_group_id = {
+        security_group_id: set().union(
+            *(
+                service_types_by_interface_id[
+                    network_interface["NetworkInterfaceId"]
+                ]
+                for network_interface in network_interfaces
+            )
+        )
+        for security_group_id, network_interfaces in (
+            network_interfaces_by_security_group_id.items()
         )
+    }
 
-        for regional_service in regional_service_types_to_lookup:
-            if region != None:
-                regional_service.set_client(region)
-            new_record[data_headers.index(regional_service.__name__)] = "\n".join(
-                regional_service.get_service_names_in_security_group(security_group)
-            )
+    ##Set clients and load the caches of every service type present in
+    ##the region up front so the per-security-group lookups below can
+    ##run concurrently without racing on lazy loads
+
+    regional_service_types_to_lookup = set().union(
+        *service_types_by_security_group_id.values()
+    )
 
-        for header, field in zip(data_headers, new_record):
-            data[header].append(field)
+    prime(regional_service_types_to_lookup, region)
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        new_records = list(
+            executor.map(
+                lambda security_group: get_security_group_record(
+                    security_group,
+                    service_types_by_security_group_id[security_group["GroupId"]],
+                    region,
+                ),
+                security_groups,
+            )
+        )
 
     print(f"fetched services for {region}")
 
-    return
+    return new_records
 
 
 if __name__ == "__main__":
@@ -153,8 +221,18 @@ if __name__ == "__main__":
         type=str,
     )
 
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        dest="refresh",
+        help="Ignore service listings cached from previous runs",
+    )
+
     args = parser.parse_args()
 
+    if args.refresh:
+        NonLookupableRegionalService._disk_cache_enabled = False
+
     access_keys_csv_path = args.access_keys_csv_path
     regions = args.regions
 
@@ -169,10 +247,24 @@ if __name__ == "__main__":
 
     assert all(region in all_regions for region in regions)
 
-    for region in regions:
-        get_associations(region)
+    ##Rows are streamed to the worksheet a region at a time instead of
+    ##being accumulated for the whole run, keeping memory flat
+
+    ##constant_memory flushes each row as it's written, which fits the
+    ##strictly in-order write_row streaming below
+
+    with xlsxwriter.Workbook(
+        write_csv_filename, {"constant_memory": True, "strings_to_urls": False}
+    ) as workbook:
+        worksheet = workbook.add_worksheet("Sheet1")
+
+        worksheet.write_row(0, 0, data_headers)
+
+        row_index = 1
+
+        for region in regions:
+            for new_record in get_associations(region):
+                worksheet.write_row(row_index, 0, new_record)
+                row_index += 1
 
-    with ps.ExcelWriter(write_csv_filename, engine="xlsxwriter", mode="w") as writer:
-        df = ps.DataFrame.from_dict(data)
-        df.to_excel(writer)
         print("written table")
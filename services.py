@@ -1,5 +1,84 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import os
+import pickle
+import re
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+
 import boto3
+from botocore.config import Config
+
+
+def _ttl_cache(seconds: int):
+    """Caches a classmethod's result per (class, client region,
+    arguments) for the given number of seconds.
+
+    The region is part of the key, so switching regions never serves a
+    stale result; switching back within the TTL reuses the old one.
+
+    Args:
+        seconds (int): how long a cached result stays fresh
+
+    Returns:
+        decorator to apply under @classmethod
+    """
+
+    def decorator(method):
+        store = {}
+
+        @functools.wraps(method)
+        def wrapper(cls, *args, **kwargs):
+            client = getattr(cls, "_client", None)
+
+            if client is not None:
+                region = client.meta.region_name
+            else:
+                region = None
+
+            key = (cls, region, args, tuple(sorted(kwargs.items())))
+
+            now = time.monotonic()
+
+            cached = store.get(key)
+
+            if cached is not None and now - cached[0] < seconds:
+                return cached[1]
+
+            result = method(cls, *args, **kwargs)
+
+            store[key] = (now, result)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _paginate(client, operation_name: str, result_key: str, **kwargs):
+    """Yields every item under result_key across all pages of the
+    given client operation.
+
+    Replaces the hand-rolled next-token loops, which had drifted apart
+    on token key casing and follow-up calls between services.
+
+    Args:
+        client:                 boto3 client to paginate on
+        operation_name (str):   name of the client operation to call
+        result_key (str):       response key holding each page's items
+
+    Yields:
+        dict: each item of each page in order
+    """
+
+    paginator = client.get_paginator(operation_name)
+
+    for page in paginator.paginate(**kwargs):
+        yield from page[result_key]
 
 
 class Service(ABC):
@@ -17,11 +96,10 @@ class Service(ABC):
         ABC: Python's built-in 'abstract base class' superclass.
 
     Attributes:
-        _aws_access_key_id (str):       Access key string for AWS user.
-
-        _aws_secret_access_key (str):   Secret key string for AWS user.
+        _session (boto3.Session):       Session shared by every service's client,
+                                        holding the supplied access keys.
 
-        _aws_session_token (str):       Session token given for temporary access.
+        _config (Config):               botocore config shared by every service's client.
 
         client_name (str):              Name of client type to request from boto3
 
@@ -31,9 +109,51 @@ class Service(ABC):
         NotImplementedError:            If set_client method for service not implemented
     """
 
-    _aws_access_key_id = ""
-    _aws_secret_access_key = ""
-    _aws_session_token = ""
+    ##One session and config shared by every service class, so clients
+    ##reuse the same credential/model loading and get a connection pool
+    ##big enough for the threaded lookups
+    _session = boto3.session.Session()
+    _config = Config(
+        max_pool_connections=50,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        tcp_keepalive=True,
+    )
+
+    ##Clients already built, keyed by client name and region, so
+    ##sweeping back and forth between regions reuses clients instead of
+    ##paying TLS and service model setup again each switch
+    _clients_by_name_and_region: dict = {}
+
+    @classmethod
+    def _make_client(cls, region: str = None):
+        """Returns a boto3 client for this service from the shared
+        session, config and stored access keys.
+
+        Clients are cached by (client name, region); a repeat request
+        returns the existing client.
+
+        Args:
+            region (str, optional): region for the client. Defaults to
+                                    None for global services.
+
+        Returns:
+            client for this service's _client_name
+        """
+
+        key = (cls._client_name, region)
+
+        client = Service._clients_by_name_and_region.get(key)
+
+        if client is None:
+            client = Service._session.client(
+                cls._client_name,
+                region_name=region,
+                config=Service._config,
+            )
+
+            Service._clients_by_name_and_region[key] = client
+
+        return client
 
     @classmethod
     def set_keys(
@@ -42,7 +162,11 @@ class Service(ABC):
         aws_secret_access_key: str = "",
         aws_session_token: str = "",
     ) -> None:
-        """Sets access keys for every use in service class
+        """Builds the shared session from the supplied access keys.
+
+        The session owns the credentials from here on, so they ride
+        boto3's provider chain instead of being re-passed into every
+        client constructor.
 
         Args:
             aws_access_key_id (str, optional):      Access key string for AWS user. Defaults to ''.
@@ -50,9 +174,19 @@ class Service(ABC):
             aws_session_token (str, optional):      Session token given for temporary access. Defaults to ''.
         """
 
-        cls._aws_access_key_id = aws_access_key_id
-        cls._aws_secret_access_key = aws_secret_access_key
-        cls._aws_session_token = aws_session_token
+        if aws_access_key_id == "":
+            ##No explicit keys: fall back to boto3's default credential
+            ##chain (environment, profiles, instance role, ...)
+            Service._session = boto3.session.Session()
+        else:
+            Service._session = boto3.session.Session(
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                aws_session_token=aws_session_token or None,
+            )
+
+        ##Cached clients hold the old keys, so they can't be reused
+        Service._clients_by_name_and_region = {}
 
         return
 
@@ -61,8 +195,9 @@ class Service(ABC):
     def client_name():
         raise NotImplementedError("Your service needs a client name")
 
+    @classmethod
     @abstractmethod
-    def set_client() -> None:
+    def set_client(cls) -> None:
         raise NotImplementedError("Your service needs a way to define a client")
 
     @classmethod
@@ -88,12 +223,7 @@ class GlobalService(Service):
 
         This does not include a region.
         """
-        cls._client = boto3.client(
-            cls._client_name,
-            aws_access_key_id=Service._aws_access_key_id,
-            aws_secret_access_key=Service._aws_secret_access_key,
-            aws_session_token=Service._aws_session_token,
-        )
+        cls._client = cls._make_client()
 
 
 class STS(GlobalService):
@@ -107,13 +237,27 @@ class STS(GlobalService):
 
     _client_name = "sts"
 
+    ##Resolved once per set of keys; the account never changes for the
+    ##lifetime of a credential
+    _account_id: str = None
+
     @classmethod
     def get_account_id(cls) -> str:
         """Gets the ID of the parent account of the access key holder"""
 
-        account_id = cls._client.get_caller_identity()["Account"]
+        if cls._account_id is None:
+            cls._account_id = cls._client.get_caller_identity()["Account"]
+
+        return cls._account_id
 
-        return account_id
+    @classmethod
+    def set_client(cls) -> None:
+        """Same as GlobalService.set_client, but also drops the cached
+        account ID so re-keying re-resolves it."""
+
+        super().set_client()
+
+        cls._account_id = None
 
 
 class Account(GlobalService):
@@ -139,38 +283,26 @@ class Account(GlobalService):
     ]
 
     @classmethod
-    def list_available_regions(cls) -> list[dict[str, str]]:
+    @_ttl_cache(3600)
+    def list_available_regions(cls) -> list[str]:
         """Gets list of regions of types specified in __accepted_region_types
 
         Returns:
-            list[dict[str, str]]: list of region information dicts
+            list[str]: list of enabled region names
         """
 
-        regions = []
-        account_id = STS.get_account_id()
-
-        region_response = cls._client.list_regions(AccountId=account_id)
-
-        if "nextToken" in region_response.keys():
-            next_token = region_response["nextToken"]
-        else:
-            next_token = None
-
-        regions.extend(region_response["clusterArns"])
-
-        while next_token != None:
-            region_response = cls._client.list_clusters(
-                AccountId=account_id, nextToken=next_token
+        ##The accepted statuses filter server-side, so disabled regions
+        ##never come over the wire
+        return [
+            region["RegionName"]
+            for region in _paginate(
+                cls._client,
+                "list_regions",
+                "Regions",
+                AccountId=STS.get_account_id(),
+                RegionOptStatusContains=cls.__accepted_region_types,
             )
-
-            if "nextToken" in region_response.keys():
-                next_token = region_response["nextToken"]
-            else:
-                next_token = None
-
-            regions.extend(region_response["clusterArns"])
-
-        return [region["RegionName"] for region in regions]
+        ]
 
 
 class IAM(GlobalService):
@@ -188,6 +320,7 @@ class IAM(GlobalService):
     _client_name = "iam"
 
     @classmethod
+    @_ttl_cache(3600)
     def get_project_name(cls) -> str:
         """Returns first alias of project"""
         alias_response = cls._client.list_account_aliases()
@@ -220,18 +353,13 @@ class RegionalService(Service):
             region (str):   The name of the region that the Service's client
                             pertains to
         """
-        cls._client = boto3.client(
-            cls._client_name,
-            aws_access_key_id=Service._aws_access_key_id,
-            aws_secret_access_key=Service._aws_secret_access_key,
-            aws_session_token=Service._aws_session_token,
-            region_name=region,
-        )
+        cls._client = cls._make_client(region)
 
         return
 
+    @classmethod
     @abstractmethod
-    def get_services_in_security_group(security_group: dict) -> list[dict]:
+    def get_services_in_security_group(cls, security_group: dict) -> list[dict]:
         """Returns list of json-like dict of info for each service in a security group
 
         Args:
@@ -247,8 +375,9 @@ class RegionalService(Service):
             "Implement a way to get a dict of comprehensive info for each service in a given security group"
         )
 
+    @classmethod
     @abstractmethod
-    def get_service_names_in_security_group(security_group: dict) -> list[str]:
+    def get_service_names_in_security_group(cls, security_group: dict) -> list[str]:
         """Returns just the names from services in security groups
 
         Args:
@@ -268,10 +397,6 @@ class RegionalService(Service):
 class EC2(RegionalService):
     """Regional service class for EC2 instance.
 
-    Also offers a resource client, since EC2 expresses
-    extra functionality in the form of different resource sessions
-    offered by boto3.
-
     Inherits:
         RegionalService:    Regional service base class
 
@@ -282,28 +407,72 @@ class EC2(RegionalService):
 
     _client_name = "ec2"
 
-    @classmethod
-    def get_resource(cls) -> boto3.Session:
-        return cls.__resource
+    ###EC2 rejects a filter carrying more than 200 values, so bulk
+    ###lookups split their ID lists into batches of at most this many
+    filter_value_batch_size = 200
+
+    ##Network interface lookups already made, cached by security group ID
+    ##so repeat probes of the same security group don't hit AWS again
+    _network_interfaces_by_security_group_id: dict[str, list] = {}
+
+    ##Whether load_network_interfaces has filled the cache for the whole
+    ##region, in which case a missing security group ID means no
+    ##network interfaces rather than an unfetched one
+    _network_interfaces_loaded = False
+
+    ##Instances indexed by security group ID by load_instances, mirroring
+    ##the load-once-then-lookup pattern of the non-lookupable services
+    _instances_by_security_group_id: dict[str, list] = {}
+    _instances_loaded = False
+
+    ##Only these network interface fields are read downstream, so the
+    ##rest of the describe_network_interfaces payload (private IPs,
+    ##attachments detail, tags) is dropped as soon as it arrives
+    __kept_network_interface_keys = [
+        "NetworkInterfaceId",
+        "InterfaceType",
+        "Description",
+        "Groups",
+        "Attachment",
+    ]
 
     @classmethod
-    def set_resource(cls) -> boto3.Session:
-        """Same thing as set_client, but for the resource session types
-        exclusive to a few services offered by boto3.
+    def _trim_network_interface(cls, network_interface: dict) -> dict:
+        """Keeps only the network interface fields the tool consumes.
+
+        Args:
+            network_interface (dict):   network interface info dict from boto3
 
         Returns:
-            boto3.Session: _description_
+            dict: the same info cut down to the keys in __kept_network_interface_keys
         """
-        cls.__resource = boto3.resource(
-            cls._client_name,
-            aws_access_key_id=Service._aws_access_key_id,
-            aws_secret_access_key=Service._aws_secret_access_key,
-            aws_session_token=Service._aws_session_token,
-        )
 
-        return
+        return {
+            key: network_interface[key]
+            for key in cls.__kept_network_interface_keys
+            if key in network_interface
+        }
+
+    @classmethod
+    def set_client(cls, region: str) -> None:
+        """Same as RegionalService.set_client, but also clears the
+        cached network interface lookups since they are per-region.
+
+        Args:
+            region (str):   The name of the region that the Service's client
+                            pertains to
+        """
+
+        super().set_client(region)
+
+        cls._network_interfaces_by_security_group_id = {}
+        cls._network_interfaces_loaded = False
+
+        cls._instances_by_security_group_id = {}
+        cls._instances_loaded = False
 
     @classmethod
+    @_ttl_cache(3600)
     def list_available_regions(cls) -> list[str]:
         """Use when you don't have perms to use Account.list_regions()
 
@@ -312,7 +481,14 @@ class EC2(RegionalService):
         """
         return [
             region["RegionName"]
-            for region in cls._client.describe_regions(AllRegions=False)["Regions"]
+            for region in cls._client.describe_regions(
+                Filters=[
+                    {
+                        "Name": "opt-in-status",
+                        "Values": ["opt-in-not-required", "opted-in"],
+                    }
+                ]
+            )["Regions"]
         ]
 
     @classmethod
@@ -322,71 +498,94 @@ class EC2(RegionalService):
         service_names = []
 
         for service in services:
-            tags = service["Tags"]
+            ##Only the Name tag matters, so stop scanning at the first hit
+            name = next(
+                (
+                    tag["Value"]
+                    for tag in service.get("Tags", [])
+                    if tag["Key"] == "Name"
+                ),
+                None,
+            )
 
-            service_names.extend([tag["Value"] for tag in tags if tag["Key"] == "Name"])
+            if name is not None:
+                service_names.append(name)
 
         return service_names
 
     @classmethod
-    def get_services_in_security_group(cls, security_group: dict) -> list[dict]:
-        instances = []
-
-        security_group_id = security_group["GroupId"]
-
-        service_response = cls._client.describe_instances(
-            Filters=[{"Name": "instance.group-id", "Values": [f"{security_group_id}"]}]
-        )
+    def load_instances(cls) -> None:
+        """Fetches every instance in the region in one paginated
+        describe_instances sweep and indexes them by security group ID.
 
-        if "nextToken" in service_response.keys():
-            next_token = service_response["nextToken"]
-        else:
-            next_token = None
+        One call (plus pagination) replaces the filtered
+        describe_instances that used to run per security group.
+        """
 
-        for reservation in service_response["Reservations"]:
-            instances.extend(reservation["Instances"])
+        instances_by_security_group_id = {}
 
-        while next_token != None:
-            service_response = cls._client.describe_instances(
-                Filters=[
-                    {"Name": "instance.group-id", "Values": [f"{security_group_id}"]}
-                ]
-            )
+        for reservation in _paginate(
+            cls._client, "describe_instances", "Reservations"
+        ):
+            for instance in reservation["Instances"]:
+                ##Downstream only reads the Name tag, so keep the
+                ##identifying fields and drop the rest of the payload
+                trimmed_instance = {
+                    key: instance[key]
+                    for key in ["InstanceId", "Tags", "SecurityGroups"]
+                    if key in instance
+                }
 
-            if "nextToken" in service_response.keys():
-                next_token = service_response["nextToken"]
-            else:
-                next_token = None
+                for security_group in instance["SecurityGroups"]:
+                    instances_by_security_group_id.setdefault(
+                        security_group["GroupId"], []
+                    ).append(trimmed_instance)
 
-            for reservation in service_response["reservations"]:
-                instances.extend(reservation["Instances"])
+        cls._instances_by_security_group_id = instances_by_security_group_id
+        cls._instances_loaded = True
 
-        return instances
+        return
 
     @classmethod
-    def get_security_groups(cls) -> list[dict]:
-        security_groups = []
+    def get_services_in_security_group(cls, security_group: dict) -> list[dict]:
+        security_group_id = security_group["GroupId"]
 
-        response = cls._client.describe_security_groups()
+        if not cls._instances_loaded:
+            cls.load_instances()
 
-        security_groups.extend(response["SecurityGroups"])
+        return cls._instances_by_security_group_id.get(security_group_id, [])
 
-        if "NextToken" in response.keys():
-            next_token = response["NextToken"]
-        else:
-            next_token = None
+    @classmethod
+    @_ttl_cache(120)
+    def get_security_groups(cls, vpc_id: str = None) -> list[dict]:
+        """Gets every security group in the region, or only one VPC's
+        when vpc_id is given.
 
-        while next_token != None:
-            response = cls.client.describe_security_groups(NextToken=next_token)
+        The VPC narrowing happens server-side via the vpc-id filter, so
+        multi-VPC accounts don't transfer and parse groups the caller
+        doesn't want. The response shape is the same either way.
 
-            security_groups.extend(response["SecurityGroups"])
+        Args:
+            vpc_id (str, optional): VPC to narrow the sweep to. Defaults to
+                                    None, returning every VPC's groups.
 
-            if "NextToken" in response.keys():
-                next_token = response["NextToken"]
-            else:
-                next_token = None
+        Returns:
+            list[dict]: list of security group info dicts
+        """
 
-        return security_groups
+        if vpc_id is not None:
+            return list(
+                _paginate(
+                    cls._client,
+                    "describe_security_groups",
+                    "SecurityGroups",
+                    Filters=[{"Name": "vpc-id", "Values": [vpc_id]}],
+                )
+            )
+
+        return list(
+            _paginate(cls._client, "describe_security_groups", "SecurityGroups")
+        )
 
     @classmethod
     def get_network_interfaces_for_security_group(
@@ -394,12 +593,130 @@ class EC2(RegionalService):
     ) -> list[dict]:
         security_group_id = security_group["GroupId"]
 
-        network_interfaces = cls._client.describe_network_interfaces(
-            Filters=[{"Name": "group-id", "Values": [f"{security_group_id}"]}]
-        )["NetworkInterfaces"]
+        if security_group_id in cls._network_interfaces_by_security_group_id:
+            return cls._network_interfaces_by_security_group_id[security_group_id]
+
+        if cls._network_interfaces_loaded:
+            return []
+
+        network_interfaces = [
+            cls._trim_network_interface(network_interface)
+            for network_interface in cls._client.describe_network_interfaces(
+                Filters=[{"Name": "group-id", "Values": [security_group_id]}]
+            )["NetworkInterfaces"]
+        ]
+
+        cls._network_interfaces_by_security_group_id[security_group_id] = (
+            network_interfaces
+        )
 
         return network_interfaces
 
+    @classmethod
+    def load_network_interfaces(cls) -> None:
+        """Fetches every network interface in the region in one
+        unfiltered paginated sweep and indexes them by security group ID.
+
+        Analogous to NonLookupableRegionalService.load_services: after
+        this, get_network_interfaces_for_security_group is an O(1) dict
+        lookup with no further AWS calls.
+        """
+
+        network_interfaces_by_security_group_id = {}
+
+        network_interfaces = [
+            cls._trim_network_interface(network_interface)
+            for network_interface in _paginate(
+                cls._client,
+                "describe_network_interfaces",
+                "NetworkInterfaces",
+                PaginationConfig={"PageSize": 1000},
+            )
+        ]
+
+        for network_interface in network_interfaces:
+            for group in network_interface["Groups"]:
+                network_interfaces_by_security_group_id.setdefault(
+                    group["GroupId"], []
+                ).append(network_interface)
+
+        cls._network_interfaces_by_security_group_id = (
+            network_interfaces_by_security_group_id
+        )
+        cls._network_interfaces_loaded = True
+
+        return
+
+    @classmethod
+    def get_network_interfaces_by_security_group_id(
+        cls, security_group_ids: list[str]
+    ) -> dict[str, list[dict]]:
+        """Fetches the network interfaces for every given security group
+        in as few filtered calls as the filter value cap allows and
+        buckets them by security group ID.
+
+        Saves one round-trip per security group over calling
+        get_network_interfaces_for_security_group in a loop.
+
+        Args:
+            security_group_ids (list[str]): IDs of every security group to look up
+
+        Returns:
+            dict[str, list[dict]]:  dict of network interface info dicts,
+                                    grouped by security group ID
+        """
+
+        ##Dedupe while keeping order so repeated IDs from the caller
+        ##don't inflate the filter values sent to AWS
+        security_group_ids = list(dict.fromkeys(security_group_ids))
+
+        network_interfaces_by_security_group_id = {
+            security_group_id: [] for security_group_id in security_group_ids
+        }
+
+        ##An interface whose groups span two ID batches comes back from
+        ##both calls, so collect by interface ID to bucket it only once
+        network_interfaces_by_id = {}
+
+        for batch_start in range(
+            0, len(security_group_ids), cls.filter_value_batch_size
+        ):
+            for network_interface in _paginate(
+                cls._client,
+                "describe_network_interfaces",
+                "NetworkInterfaces",
+                Filters=[
+                    {
+                        "Name": "group-id",
+                        "Values": security_group_ids[
+                            batch_start : batch_start + cls.filter_value_batch_size
+                        ],
+                    }
+                ],
+                PaginationConfig={"PageSize": 1000},
+            ):
+                network_interfaces_by_id.setdefault(
+                    network_interface["NetworkInterfaceId"],
+                    cls._trim_network_interface(network_interface),
+                )
+
+        network_interfaces = list(network_interfaces_by_id.values())
+
+        for network_interface in network_interfaces:
+            for group in network_interface["Groups"]:
+                group_id = group["GroupId"]
+
+                if group_id in network_interfaces_by_security_group_id:
+                    network_interfaces_by_security_group_id[group_id].append(
+                        network_interface
+                    )
+
+        cls._network_interfaces_by_security_group_id.update(
+            network_interfaces_by_security_group_id
+        )
+
+        return network_interfaces_by_security_group_id
+
     @staticmethod
     def get_service_types_from_network_interfaces(
         network_interface_jsons: list[str],
@@ -424,33 +741,26 @@ class EC2(RegionalService):
 
             instance_id = None
 
-            if "Attachment" in network_interface_json.keys():
-                if "InstanceId" in network_interface_json["Attachment"].keys():
+            if "Attachment" in network_interface_json:
+                if "InstanceId" in network_interface_json["Attachment"]:
                     instance_id = network_interface_json["Attachment"]["InstanceId"]
 
             if interface_type == "lambda":
                 services_to_lookup.add(Lambda)
             elif any(
-                [
-                    "ElasticMapReduce" in security_group["GroupName"]
-                    for security_group in security_groups
-                ]
+                "ElasticMapReduce" in security_group["GroupName"]
+                for security_group in security_groups
             ):
                 services_to_lookup.add(EMR)
-            elif instance_id != None:
+            elif instance_id is not None:
                 services_to_lookup.add(EC2)
-            elif "arn:aws:ecs" in description:
-                services_to_lookup.add(ECS)
-            elif "ELB app" in description:
-                services_to_lookup.add(ALB)
-            elif "RDSNetworkInterface" in description:
-                services_to_lookup.add(RDS)
-            elif "DMSNetworkInterface" in description:
-                services_to_lookup.add(DMS)
-            elif "RedshiftNetworkInterface" in description:
-                services_to_lookup.add(Redshift)
-            elif "ElastiCache" in description:
-                services_to_lookup.add(ElastiCache)
+            else:
+                match = _description_marker_pattern.search(description)
+
+                if match is not None:
+                    services_to_lookup.add(
+                        _service_types_by_description_marker[match.group(0)]
+                    )
 
         return services_to_lookup
 
@@ -468,262 +778,437 @@ class NonLookupableRegionalService(RegionalService):
         RegionalService: Class for all regional services.
 
     Raises:
-        NotImplementedError: If services_by_security_group_id not implemented.
+        NotImplementedError: If services_by_region not implemented.
 
-        NotImplementedError: If load_services not implemented.
-        NotImplementedError: If get_service_names_in_security_group not implemented.
+        NotImplementedError: If _get_security_group_ids not implemented.
 
     Attributes:
-        services_by_security_group_id (dict[str,dict]): dict of services, grouped by the ID of the security group they belong to
+        services_by_region (dict[str,dict]):    per region, dict of services grouped by the ID
+                                                of the security group they belong to
+
+        _list_operation_name (str):             client operation that lists every service of this type
+
+        _list_result_key (str):                 response key holding the listed services
+
+        _name_key (str):                        key of a service's display name in its info dict
     """
 
+    ##How long a loaded service cache stays fresh before a query
+    ##triggers a reload, and when each region was last loaded
+    ##(monotonic)
+    _cache_ttl_seconds = 60
+
+    ##Loads build into a staging index and are serialized per
+    ##(class, region), so concurrent queries keep reading the old index
+    ##until a finished replacement is swapped in whole
+    _load_locks: dict = {}
+    _load_locks_guard = threading.Lock()
+    _staging_indexes: dict = {}
+
+    ##Between-run cache of load_services results, keyed per account,
+    ##region and service class so nothing leaks across accounts.
+    ##Disable (e.g. via the --refresh flag) to force fresh sweeps.
+    _disk_cache_enabled = True
+    _disk_cache_ttl_seconds = 15 * 60
+    _disk_cache_directory = Path.home() / ".cache" / "security-group-mapper"
+
     @property
     @abstractmethod
-    def services_by_security_group_id():
+    def services_by_region():
         raise NotImplementedError()
 
+    @classmethod
+    def _region(cls) -> str:
+        """Region of the currently set client."""
+
+        return cls._client.meta.region_name
+
+    @classmethod
+    def _load_lock(cls, region: str) -> threading.Lock:
+        """Lock serializing loads of this class's index for a region."""
+
+        with NonLookupableRegionalService._load_locks_guard:
+            return NonLookupableRegionalService._load_locks.setdefault(
+                (cls, region), threading.Lock()
+            )
+
+    @classmethod
     @abstractmethod
-    def load_services():
-        """Loads services to a flat list.
+    def _get_security_group_ids(cls, service: dict) -> list[str]:
+        """Pulls the IDs of every security group a service belongs to
+        out of its info dict.
 
-        Implementation will vary with service type.
+        Args:
+            service (dict): dict of service info from boto3
 
         Raises:
             NotImplementedError: If not implemented.
+
+        Returns:
+            list[str]: security group IDs the service belongs to
         """
         raise NotImplementedError(
-            "This NonlookupableRegionalService needs a way to load its services to its dict"
+            "This NonLookupableRegionalService needs a way to read a service's security group IDs"
         )
 
-    @abstractmethod
-    def get_service_names_in_security_group(cls, security_group: dict) -> list[str]:
-        raise NotImplementedError()
+    ##Fields kept per stored service on top of the name key; extend in
+    ##a subclass if downstream ever needs more of its payload
+    _kept_service_keys: list[str] = []
+
+    @classmethod
+    def _trim_service(cls, service: dict) -> dict:
+        """Cuts a service's info dict down to the name key plus
+        _kept_service_keys before it's stored in the index, so the bulk
+        of each boto payload isn't retained (or written to the disk
+        cache) just to read one name later.
+
+        Args:
+            service (dict): dict of service info from boto3
+
+        Returns:
+            dict: the same info reduced to the kept keys
+        """
+
+        kept_keys = [cls._name_key] + cls._kept_service_keys
+
+        return {key: service[key] for key in kept_keys if key in service}
+
+    @classmethod
+    def _add_service(cls, service: dict) -> None:
+        """Adds one service to the current region's in-progress load
+        index under every security group it belongs to.
+
+        Only valid inside load_services: the staging index it writes to
+        exists for exactly the duration of a load.
+
+        Args:
+            service (dict): dict of service info from boto3
+        """
+
+        trimmed_service = cls._trim_service(service)
+
+        services_by_security_group_id = NonLookupableRegionalService._staging_indexes[
+            (cls, cls._region())
+        ]
+
+        for security_group_id in cls._get_security_group_ids(service):
+            services_by_security_group_id.setdefault(security_group_id, []).append(
+                trimmed_service
+            )
+
+        return
+
+    @classmethod
+    def load_services(cls) -> None:
+        """Loads every service of this type in the region and groups
+        them by security group ID.
+
+        Driven by _list_operation_name, _list_result_key and
+        _get_security_group_ids, so most services only declare how
+        their payload is shaped. Services whose listing needs extra
+        calls (ECS, EMR) override this.
+        """
+
+        for service in _paginate(
+            cls._client, cls._list_operation_name, cls._list_result_key
+        ):
+            cls._add_service(service)
+
+        return
+
+    @classmethod
+    def get_service_names_in_security_group(
+        cls, security_group: dict, region: str = None
+    ) -> list[str]:
+        services = cls.get_services_in_security_group(security_group, region)
+
+        service_names = [service[cls._name_key] for service in services]
+
+        return service_names
 
     @classmethod
-    def get_services_in_security_group(cls, security_group: list[dict]) -> list[dict]:
+    def get_services_in_security_group(
+        cls, security_group: list[dict], region: str = None
+    ) -> list[dict]:
         """Returns list of json-like dict of info for each service in a security group
         from a class attribute of all services of that type grouped by security group ID
 
         Args:
             security_group (dict):  dict of information from boto3 about a security group
 
+            region (str):           region to answer from, defaults to the client's region
+
         Returns:
             list[dict]: List of dicts of service info for services that belong to a given security group
         """
 
         security_group_id = security_group["GroupId"]
 
-        if not cls.has_services():
-            cls.load_services()
+        if region is None:
+            region = cls._region()
 
-        if security_group_id in cls._services_by_security_group_id.keys():
-            services = cls._services_by_security_group_id[security_group_id]
-        else:
-            services = []
+        cls.ensure_services_loaded(region)
 
-        return services
+        return cls._services_by_region[region].get(security_group_id, [])
 
     @classmethod
-    def has_services(cls):
-        return len(cls._services_by_security_group_id.keys()) > 0
+    def get_services_for(
+        cls, security_group_ids: list[str], region: str = None
+    ) -> dict[str, list]:
+        """Bulk form of get_services_in_security_group: answers many
+        security group IDs in one tight loop over the loaded index.
 
-    @classmethod
-    def set_client(cls, region: str) -> None:
-        """Set client method for a non-lookupable regional service.
+        Args:
+            security_group_ids (list[str]): IDs of the security groups to look up
 
-        Uses a predefined _client_name string to specify
-        what type of client to request from boto3.
+            region (str):                   region to answer from, defaults to the client's region
+
+        Returns:
+            dict[str, list]:    dicts of service info per security group ID,
+                                empty list for groups with no services of this type
+        """
+
+        if region is None:
+            region = cls._region()
+
+        cls.ensure_services_loaded(region)
+
+        services_by_security_group_id = cls._services_by_region[region]
 
-        Same implementation as RegionalService.set_client, but
-        clears the service types storage of services group by security ID
+        return {
+            security_group_id: services_by_security_group_id.get(security_group_id, [])
+            for security_group_id in security_group_ids
+        }
+
+    @classmethod
+    def ensure_services_loaded(cls, region: str = None) -> None:
+        """Loads this service's cache for a region if it has never
+        been loaded or its TTL has lapsed, and stamps the load time.
+
+        Each region keeps its own index, so switching regions never
+        throws away another region's loaded data. Loads are serialized
+        per (class, region); callers that lose the race block until the
+        winner's load lands rather than sweeping the region again.
 
         Args:
-            region (str):   The name of the region that the Service's client
-                            pertains to
+            region (str):   region to load, defaults to the client's region
         """
 
-        super().set_client(region)
+        if region is None:
+            region = cls._region()
 
-        cls.services_by_security_group_id = {}
+        if cls.has_services(region):
+            return
 
+        with cls._load_lock(region):
+            ##Another thread may have finished this load while waiting
+            ##on the lock
+            if cls.has_services(region):
+                return
 
-class ECS(NonLookupableRegionalService):
-    """Deals with lookup for ECS services
+            if not (cls._disk_cache_enabled and cls._load_services_from_disk(region)):
+                staging_key = (cls, region)
 
-    Inherits:
-        NonLookupableRegionalService:   RegionalService class for service types that cannot be asked
-                                        directly what services of theirs belong to a given security group
+                NonLookupableRegionalService._staging_indexes[staging_key] = {}
 
-    """
+                cls.load_services()
 
-    _client_name = "ecs"
-    _services_by_security_group_id: dict[str, list] = {}
+                loaded_index = NonLookupableRegionalService._staging_indexes.pop(
+                    staging_key
+                )
 
-    ###boto3 docs state ecs client.describe_services can only
-    ###take a max of take 10 services at a time
-    lookup_batch_size = 10
+                ##Swapped in whole and frozen, so concurrent readers see
+                ##either the previous index or the finished one — never
+                ##a half-built dict. Tuples drop the growth slack the
+                ##load's appends left
+                cls._services_by_region[region] = MappingProxyType(
+                    {
+                        security_group_id: tuple(services)
+                        for security_group_id, services in loaded_index.items()
+                    }
+                )
 
-    @classmethod
-    def load_services(cls) -> None:
-        service_arns_by_cluster_arn = {}
+                if cls._disk_cache_enabled:
+                    cls._dump_services_to_disk(region)
 
-        cluster_arns = []
+            cls._services_loaded_at_by_region[region] = time.monotonic()
 
-        cluster_arn_response = cls._client.list_clusters()
+        return
 
-        if "nextToken" in cluster_arn_response.keys():
-            next_token = cluster_arn_response["nextToken"]
-        else:
-            next_token = None
+    @classmethod
+    def _disk_cache_path(cls, region: str) -> Path:
+        """Path of this service's between-run cache file for the
+        current account and the given region."""
 
-        cluster_arns.extend(cluster_arn_response["clusterArns"])
+        account_id = STS.get_account_id()
 
-        while next_token != None:
-            cluster_arn_response = cls._client.list_clusters(nextToken=next_token)
+        return cls._disk_cache_directory / f"{account_id}-{region}-{cls.__name__}.pkl"
 
-            if "nextToken" in cluster_arn_response.keys():
-                next_token = cluster_arn_response["nextToken"]
-            else:
-                next_token = None
+    @classmethod
+    def _load_services_from_disk(cls, region: str) -> bool:
+        """Fills a region's service index from the between-run cache
+        if a fresh enough file exists.
 
-            cluster_arns.extend(cluster_arn_response["clusterArns"])
+        Args:
+            region (str):   region to fill
 
-        for cluster_arn in cluster_arns:
-            service_arns = []
+        Returns:
+            bool: whether the index was filled from disk
+        """
 
-            service_arn_response = cls._client.list_services(cluster=cluster_arn)
+        cache_path = cls._disk_cache_path(region)
 
-            if "nextToken" in service_arn_response.keys():
-                next_token = service_arn_response["nextToken"]
-            else:
-                next_token = None
+        if not cache_path.exists():
+            return False
 
-            service_arns.extend(service_arn_response["serviceArns"])
+        if time.time() - cache_path.stat().st_mtime > cls._disk_cache_ttl_seconds:
+            return False
 
-            while next_token != None:
-                service_arn_response = cls._client.list_services(
-                    cluster=cluster_arn, nextToken=next_token
-                )
+        try:
+            with open(cache_path, "rb") as cache_file:
+                loaded_index = pickle.load(cache_file)
+        except Exception:
+            ##An unreadable or truncated file (e.g. a run killed
+            ##mid-write) is just a cache miss; the fresh load that
+            ##follows will overwrite it
+            return False
 
-                if "nextToken" in service_arn_response.keys():
-                    next_token = service_arn_response["nextToken"]
-                else:
-                    next_token = None
+        cls._services_by_region[region] = MappingProxyType(loaded_index)
 
-                service_arns.extend(service_arn_response["serviceArns"])
+        return True
 
-            service_arns_by_cluster_arn[cluster_arn] = service_arns
+    @classmethod
+    def _dump_services_to_disk(cls, region: str) -> None:
+        """Writes a region's loaded service index to the between-run
+        cache.
 
-        for cluster_arn in service_arns_by_cluster_arn.keys():
+        Args:
+            region (str):   region to write out
+        """
 
-            service_arns = service_arns_by_cluster_arn[cluster_arn]
+        cache_path = cls._disk_cache_path(region)
 
-            service_arns_len = len(service_arns)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-            for service_arn_index in range(0, service_arns_len, cls.lookup_batch_size):
+        ##Written to a sibling temp file and swapped in atomically, so
+        ##a crash mid-write can't leave a truncated cache behind
+        temporary_path = cache_path.with_name(cache_path.name + ".tmp")
 
-                if service_arns_len - service_arn_index < cls.lookup_batch_size:
-                    service_response = cls._client.describe_services(
-                        cluster=cluster_arn, services=service_arns[service_arn_index:]
-                    )
-                else:
-                    service_response = cls._client.describe_services(
-                        cluster=cluster_arn,
-                        services=service_arns[
-                            service_arn_index : cls.lookup_batch_size
-                        ],
-                    )
+        with open(temporary_path, "wb") as cache_file:
+            pickle.dump(dict(cls._services_by_region[region]), cache_file)
 
-                for service in service_response["services"]:
-                    security_groups = service["networkConfiguration"][
-                        "awsvpcConfiguration"
-                    ]["securityGroups"]
-
-                    for security_group in security_groups:
-                        if (
-                            security_group
-                            not in cls._services_by_security_group_id.keys()
-                        ):
-                            cls._services_by_security_group_id[security_group] = [
-                                service
-                            ]
-                        else:
-                            cls._services_by_security_group_id[security_group].append(
-                                service
-                            )
+        os.replace(temporary_path, cache_path)
 
         return
 
     @classmethod
-    def get_service_names_in_security_group(cls, security_group: dict) -> list[str]:
-        services = cls.get_services_in_security_group(security_group)
+    def has_services(cls, region: str = None):
+        if region is None:
+            region = cls._region()
 
-        service_names = [service["serviceName"] for service in services]
+        loaded_at = cls._services_loaded_at_by_region.get(region)
 
-        return service_names
+        return (
+            loaded_at is not None
+            and time.monotonic() - loaded_at < cls._cache_ttl_seconds
+        )
 
 
-class ALB(NonLookupableRegionalService):
-    """Deals with lookup for application ELB services
+class ECS(NonLookupableRegionalService):
+    """Deals with lookup for ECS services
 
     Inherits:
-        NonLookupableRegionalService:                       RegionalService class for service types that cannot be asked
-                                                            directly what services of theirs belong to a given security group
+        NonLookupableRegionalService:   RegionalService class for service types that cannot be asked
+                                        directly what services of theirs belong to a given security group
 
-    Attributes:
-        _client_name (str):                                 Name of client type to be requested from boto3
-        _services_by_security_group_id (dict[str,list]):    dict of service information grouped by security group ID
     """
 
-    _client_name = "elbv2"
-    _services_by_security_group_id: dict[str, list] = {}
+    _client_name = "ecs"
+    _services_by_region: dict[str, dict[str, list]] = {}
+    _services_loaded_at_by_region: dict[str, float] = {}
+
+    _name_key = "serviceName"
+
+    ###boto3 docs state ecs client.describe_services can only
+    ###take a max of take 10 services at a time
+    lookup_batch_size = 10
+
+    @classmethod
+    def _get_security_group_ids(cls, service: dict) -> list[str]:
+        return service["networkConfiguration"]["awsvpcConfiguration"][
+            "securityGroups"
+        ]
 
     @classmethod
     def load_services(cls) -> None:
+        service_arns_by_cluster_arn = {}
 
-        services = []
+        cluster_arns = list(_paginate(cls._client, "list_clusters", "clusterArns"))
 
-        service_response = cls._client.describe_load_balancers()
+        for cluster_arn in cluster_arns:
+            service_arns_by_cluster_arn[cluster_arn] = list(
+                _paginate(
+                    cls._client, "list_services", "serviceArns", cluster=cluster_arn
+                )
+            )
 
-        if "NextMarker" in service_response.keys():
-            next_token = service_response["NextMarker"]
-        else:
-            next_token = None
+        ##Each describe_services call is an independent read, so batch
+        ##every cluster's ARNs into lookup_batch_size chunks and overlap
+        ##the calls on a thread pool, merging in the main thread
+        batches = [
+            (
+                cluster_arn,
+                service_arns[
+                    service_arn_index : service_arn_index + cls.lookup_batch_size
+                ],
+            )
+            for cluster_arn, service_arns in service_arns_by_cluster_arn.items()
+            for service_arn_index in range(0, len(service_arns), cls.lookup_batch_size)
+        ]
 
-        services.extend(service_response["LoadBalancers"])
+        if len(batches) == 0:
+            return
 
-        while next_token != None:
-            service_response = cls._client.describe_load_balancers(Marker=next_token)
+        with ThreadPoolExecutor(max_workers=min(10, len(batches))) as executor:
+            service_responses = list(
+                executor.map(
+                    lambda batch: cls._client.describe_services(
+                        cluster=batch[0], services=batch[1]
+                    ),
+                    batches,
+                )
+            )
 
-            if "NextMarker" in service_response.keys():
-                next_token = service_response["NextMarker"]
-            else:
-                next_token = None
+        for service_response in service_responses:
+            for service in service_response["services"]:
+                cls._add_service(service)
 
-            services.extend(service_response["LoadBalancers"])
+        return
 
-        for service in services:
-            if "SecurityGroups" in service.keys():
-                security_groups = service["SecurityGroups"]
 
-                for security_group in security_groups:
-                    if security_group not in cls._services_by_security_group_id.keys():
-                        cls._services_by_security_group_id[security_group] = [service]
-                    else:
-                        cls._services_by_security_group_id[security_group].append(
-                            service
-                        )
+class ALB(NonLookupableRegionalService):
+    """Deals with lookup for application ELB services
 
-        return
+    Inherits:
+        NonLookupableRegionalService:                       RegionalService class for service types that cannot be asked
+                                                            directly what services of theirs belong to a given security group
 
-    @classmethod
-    def get_service_names_in_security_group(cls, security_group: dict) -> list[str]:
+    Attributes:
+        _client_name (str):                                 Name of client type to be requested from boto3
+        _services_by_region (dict[str,dict[str,list]]): per region, dict of service information grouped by security group ID
+    """
 
-        services = cls.get_services_in_security_group(security_group)
+    _client_name = "elbv2"
+    _services_by_region: dict[str, dict[str, list]] = {}
+    _services_loaded_at_by_region: dict[str, float] = {}
 
-        service_names = [service["LoadBalancerName"] for service in services]
+    _list_operation_name = "describe_load_balancers"
+    _list_result_key = "LoadBalancers"
+    _name_key = "LoadBalancerName"
 
-        return service_names
+    @classmethod
+    def _get_security_group_ids(cls, service: dict) -> list[str]:
+        return service.get("SecurityGroups", [])
 
 
 class RDS(NonLookupableRegionalService):
@@ -735,57 +1220,23 @@ class RDS(NonLookupableRegionalService):
 
     Attributes:
         _client_name (str):                                 Name of client type to be requested from boto3
-        _services_by_security_group_id (dict[str,list]):    dict of service information grouped by security group ID
+        _services_by_region (dict[str,dict[str,list]]): per region, dict of service information grouped by security group ID
     """
 
     _client_name = "rds"
-    _services_by_security_group_id: dict[str, list] = {}
-
-    @classmethod
-    def load_services(cls) -> None:
-        services = []
-
-        service_response = cls._client.describe_db_instances()
-
-        if "NextMarker" in service_response.keys():
-            next_token = service_response["NextMarker"]
-        else:
-            next_token = None
-
-        services.extend(service_response["DBInstances"])
-
-        while next_token != None:
-            service_response = cls._client.describe_db_instances(Marker=next_token)
-
-            if "NextMarker" in service_response.keys():
-                next_token = service_response["NextMarker"]
-            else:
-                next_token = None
-
-            services.extend(service_response["DBInstances"])
-
-        for service in services:
-            if "VpcSecurityGroups" in service.keys():
-                security_groups = service["VpcSecurityGroups"]
-
-                for security_group in security_groups:
-                    security_group = security_group["VpcSecurityGroupId"]
-                    if security_group not in cls._services_by_security_group_id.keys():
-                        cls._services_by_security_group_id[security_group] = [service]
-                    else:
-                        cls._services_by_security_group_id[security_group].append(
-                            service
-                        )
+    _services_by_region: dict[str, dict[str, list]] = {}
+    _services_loaded_at_by_region: dict[str, float] = {}
 
-        return
+    _list_operation_name = "describe_db_instances"
+    _list_result_key = "DBInstances"
+    _name_key = "DBInstanceIdentifier"
 
     @classmethod
-    def get_service_names_in_security_group(cls, security_group: dict) -> list[str]:
-        services = cls.get_services_in_security_group(security_group)
-
-        service_names = [service["DBInstanceIdentifier"] for service in services]
-
-        return service_names
+    def _get_security_group_ids(cls, service: dict) -> list[str]:
+        return [
+            security_group["VpcSecurityGroupId"]
+            for security_group in service.get("VpcSecurityGroups", [])
+        ]
 
 
 class Redshift(NonLookupableRegionalService):
@@ -797,58 +1248,24 @@ class Redshift(NonLookupableRegionalService):
 
     Attributes:
         _client_name (str):                                 Name of client type to be requested from boto3
-        _services_by_security_group_id (dict[str,list]):    dict of service information grouped by security group ID
+        _services_by_region (dict[str,dict[str,list]]): per region, dict of service information grouped by security group ID
 
     """
 
     _client_name = "redshift"
-    _services_by_security_group_id: dict[str, list] = {}
-
-    @classmethod
-    def load_services(cls) -> None:
-        services = []
-
-        service_response = cls._client.describe_clusters()
-
-        if "NextMarker" in service_response.keys():
-            next_token = service_response["NextMarker"]
-        else:
-            next_token = None
+    _services_by_region: dict[str, dict[str, list]] = {}
+    _services_loaded_at_by_region: dict[str, float] = {}
 
-        services.extend(service_response["Clusters"])
-
-        while next_token != None:
-            service_response = cls._client.describe_db_instances(Marker=next_token)
-
-            if "NextMarker" in service_response.keys():
-                next_token = service_response["NextMarker"]
-            else:
-                next_token = None
-
-            services.extend(service_response["Clusters"])
-
-        for service in services:
-            if "VpcSecurityGroups" in service.keys():
-                security_groups = service["VpcSecurityGroups"]
-
-                for security_group in security_groups:
-                    security_group = security_group["VpcSecurityGroupId"]
-                    if security_group not in cls._services_by_security_group_id.keys():
-                        cls._services_by_security_group_id[security_group] = [service]
-                    else:
-                        cls._services_by_security_group_id[security_group].append(
-                            service
-                        )
-
-        return
+    _list_operation_name = "describe_clusters"
+    _list_result_key = "Clusters"
+    _name_key = "ClusterIdentifier"
 
     @classmethod
-    def get_service_names_in_security_group(cls, security_group: dict) -> list[str]:
-        services = cls.get_services_in_security_group(security_group)
-
-        service_names = [service["ClusterIdentifier"] for service in services]
-
-        return service_names
+    def _get_security_group_ids(cls, service: dict) -> list[str]:
+        return [
+            security_group["VpcSecurityGroupId"]
+            for security_group in service.get("VpcSecurityGroups", [])
+        ]
 
 
 class Lambda(NonLookupableRegionalService):
@@ -860,62 +1277,21 @@ class Lambda(NonLookupableRegionalService):
 
     Attributes:
         _client_name (str):                                 Name of client type to be requested from boto3
-        _services_by_security_group_id (dict[str,list]):    dict of service information grouped by security group ID
+        _services_by_region (dict[str,dict[str,list]]): per region, dict of service information grouped by security group ID
 
     """
 
     _client_name = "lambda"
-    _services_by_security_group_id: dict[str, list] = {}
-
-    @classmethod
-    def load_services(cls) -> None:
-        services = []
-
-        service_response = cls._client.list_functions()
-
-        if "NextMarker" in service_response.keys():
-            next_token = service_response["NextMarker"]
-        else:
-            next_token = None
+    _services_by_region: dict[str, dict[str, list]] = {}
+    _services_loaded_at_by_region: dict[str, float] = {}
 
-        services.extend(service_response["Functions"])
-
-        while next_token != None:
-            service_response = cls._client.describe_db_instances(Marker=next_token)
-
-            if "NextMarker" in service_response.keys():
-                next_token = service_response["NextMarker"]
-            else:
-                next_token = None
-
-            services.extend(service_response["Functions"])
-
-        for service in services:
-            if "VpcConfig" in service.keys():
-                security_group_ids = service["VpcConfig"]["SecurityGroupIds"]
-
-                for security_group_id in security_group_ids:
-                    if (
-                        security_group_id
-                        not in cls._services_by_security_group_id.keys()
-                    ):
-                        cls._services_by_security_group_id[security_group_id] = [
-                            service
-                        ]
-                    else:
-                        cls._services_by_security_group_id[security_group_id].append(
-                            service
-                        )
-
-        return
+    _list_operation_name = "list_functions"
+    _list_result_key = "Functions"
+    _name_key = "FunctionName"
 
     @classmethod
-    def get_service_names_in_security_group(cls, security_group: dict) -> list[str]:
-        services = cls.get_services_in_security_group(security_group)
-
-        service_names = [service["FunctionName"] for service in services]
-
-        return service_names
+    def _get_security_group_ids(cls, service: dict) -> list[str]:
+        return service.get("VpcConfig", {}).get("SecurityGroupIds", [])
 
 
 class ElastiCache(NonLookupableRegionalService):
@@ -927,64 +1303,24 @@ class ElastiCache(NonLookupableRegionalService):
 
     Attributes:
         _client_name (str):                                 Name of client type to be requested from boto3
-        _services_by_security_group_id (dict[str,list]):    dict of service information grouped by security group ID
+        _services_by_region (dict[str,dict[str,list]]): per region, dict of service information grouped by security group ID
 
     """
 
     _client_name = "elasticache"
-    _services_by_security_group_id: dict[str, list] = {}
-
-    @classmethod
-    def load_services(cls) -> None:
-
-        services = []
-
-        service_response = cls._client.describe_cache_clusters()
-
-        if "NextMarker" in service_response.keys():
-            next_token = service_response["NextMarker"]
-        else:
-            next_token = None
-
-        services.extend(service_response["CacheClusters"])
+    _services_by_region: dict[str, dict[str, list]] = {}
+    _services_loaded_at_by_region: dict[str, float] = {}
 
-        while next_token != None:
-            service_response = cls._client.describe_load_balancers(Marker=next_token)
-
-            if "NextMarker" in service_response.keys():
-                next_token = service_response["NextMarker"]
-            else:
-                next_token = None
-
-            services.extend(service_response["CacheClusters"])
-
-        for service in services:
-            if "SecurityGroups" in service.keys():
-                security_groups = service["SecurityGroups"]
-
-                for security_group in security_groups:
-                    security_group_id = security_group["SecurityGroupId"]
-                    if (
-                        security_group_id
-                        not in cls._services_by_security_group_id.keys()
-                    ):
-                        cls._services_by_security_group_id[security_group_id] = [
-                            service
-                        ]
-                    else:
-                        cls._services_by_security_group_id[security_group_id].append(
-                            service
-                        )
-
-        return
+    _list_operation_name = "describe_cache_clusters"
+    _list_result_key = "CacheClusters"
+    _name_key = "CacheClusterId"
 
     @classmethod
-    def get_service_names_in_security_group(cls, security_group: dict) -> list[str]:
-        services = cls.get_services_in_security_group(security_group)
-
-        service_names = [service["CacheClusterId"] for service in services]
-
-        return service_names
+    def _get_security_group_ids(cls, service: dict) -> list[str]:
+        return [
+            security_group["SecurityGroupId"]
+            for security_group in service.get("SecurityGroups", [])
+        ]
 
 
 class DMS(NonLookupableRegionalService):
@@ -996,67 +1332,25 @@ class DMS(NonLookupableRegionalService):
 
     Attributes:
         _client_name (str):                                 Name of client type to be requested from boto3
-        _services_by_security_group_id (dict[str,list]):    dict of service information grouped by security group ID
+        _services_by_region (dict[str,dict[str,list]]): per region, dict of service information grouped by security group ID
 
     """
 
     _client_name = "dms"
-    _services_by_security_group_id: dict[str, list] = {}
-
-    @classmethod
-    def load_services(cls) -> None:
-
-        services = []
-
-        service_response = cls._client.describe_replication_instances()
-
-        if "NextMarker" in service_response.keys():
-            next_token = service_response["NextMarker"]
-        else:
-            next_token = None
+    _services_by_region: dict[str, dict[str, list]] = {}
+    _services_loaded_at_by_region: dict[str, float] = {}
 
-        services.extend(service_response["ReplicationInstances"])
-
-        while next_token != None:
-            service_response = cls._client.describe_load_balancers(Marker=next_token)
-
-            if "NextMarker" in service_response.keys():
-                next_token = service_response["NextMarker"]
-            else:
-                next_token = None
-
-            services.extend(service_response["ReplicationInstances"])
-
-        for service in services:
-            if "VpcSecurityGroups" in service.keys():
-                security_groups = service["VpcSecurityGroups"]
-
-                for security_group in security_groups:
-                    security_group_id = security_group["VpcSecurityGroupId"]
-                    if (
-                        security_group_id
-                        not in cls._services_by_security_group_id.keys()
-                    ):
-                        cls._services_by_security_group_id[security_group_id] = [
-                            service
-                        ]
-                    else:
-                        cls._services_by_security_group_id[security_group_id].append(
-                            service
-                        )
-
-        return
+    _list_operation_name = "describe_replication_instances"
+    _list_result_key = "ReplicationInstances"
+    _name_key = "ReplicationInstanceIdentifier"
 
     @classmethod
-    def get_service_names_in_security_group(cls, security_group: dict) -> list[str]:
-        services = cls.get_services_in_security_group(security_group)
-
-        service_names = [
-            service["ReplicationInstanceIdentifier"] for service in services
+    def _get_security_group_ids(cls, service: dict) -> list[str]:
+        return [
+            security_group["VpcSecurityGroupId"]
+            for security_group in service.get("VpcSecurityGroups", [])
         ]
 
-        return service_names
-
 
 class EMR(NonLookupableRegionalService):
     """Deals with lookup for EMR services
@@ -1067,13 +1361,16 @@ class EMR(NonLookupableRegionalService):
 
     Attributes:
         _client_name (str):                                 Name of client type to be requested from boto3
-        _services_by_security_group_id (dict[str,list]):    dict of service information grouped by security group ID
+        _services_by_region (dict[str,dict[str,list]]): per region, dict of service information grouped by security group ID
         __cluster_states (list[str]):                       List of states to filter with in cluster lookup
 
     """
 
     _client_name = "emr"
-    _services_by_security_group_id: dict[str, list] = {}
+    _services_by_region: dict[str, dict[str, list]] = {}
+    _services_loaded_at_by_region: dict[str, float] = {}
+
+    _name_key = "Name"
 
     # Look for clusters in these states only
     __cluster_states = [
@@ -1089,69 +1386,120 @@ class EMR(NonLookupableRegionalService):
     @classmethod
     def load_services(cls) -> None:
 
-        cluster_ids = []
+        cluster_ids = [
+            cluster["Id"]
+            for cluster in _paginate(
+                cls._client,
+                "list_clusters",
+                "Clusters",
+                ClusterStates=cls.__cluster_states,
+            )
+        ]
 
-        cluster_list_response = cls._client.list_clusters(
-            ClusterStates=cls.__cluster_states
-        )
+        if len(cluster_ids) == 0:
+            return
+
+        ##Each cluster needs its own describe_cluster call, so fan the
+        ##independent round-trips out over a bounded thread pool
+        with ThreadPoolExecutor(max_workers=min(20, len(cluster_ids))) as executor:
+            clusters = list(
+                executor.map(
+                    lambda cluster_id: cls._client.describe_cluster(
+                        ClusterId=cluster_id
+                    )["Cluster"],
+                    cluster_ids,
+                )
+            )
 
-        cluster_ids.extend(
-            [cluster["Id"] for cluster in cluster_list_response["Clusters"]]
-        )
+        for cluster in clusters:
+            cls._add_service(cluster)
 
-        if "NextMarker" in cluster_list_response.keys():
-            next_token = cluster_list_response["NextMarker"]
-        else:
-            next_token = None
+        return
 
-        while next_token != None:
-            cluster_list_response = cls._client.list_clusters(
-                ClusterStates=cls.__cluster_states, Marker=next_token
-            )
+    @classmethod
+    def _get_security_group_ids(cls, service: dict) -> list[str]:
+        security_group_ids = []
 
-            cluster_ids.extend(
-                [cluster["Id"] for cluster in cluster_list_response["Clusters"]]
-            )
+        ec2_attributes = service["Ec2InstanceAttributes"]
 
-        for cluster_id in cluster_ids:
-            security_group_ids = []
+        security_group_ids.append(ec2_attributes["EmrManagedMasterSecurityGroup"])
+        security_group_ids.append(ec2_attributes["EmrManagedSlaveSecurityGroup"])
 
-            cluster_response = cls._client.describe_cluster(ClusterId=cluster_id)
+        # This one is for a SG that allows acces to private subnets (I don't 100% understand that)
+        service_access_security_group = ec2_attributes.get("ServiceAccessSecurityGroup")
 
-            cluster = cluster_response["Cluster"]
-            ec2_attributes = cluster["Ec2InstanceAttributes"]
+        if service_access_security_group is not None:
+            security_group_ids.append(service_access_security_group)
 
-            security_group_ids.append(ec2_attributes["EmrManagedMasterSecurityGroup"])
-            security_group_ids.append(ec2_attributes["EmrManagedSlaveSecurityGroup"])
+        # These two may contain many security groups
+        security_group_ids.extend(
+            ec2_attributes.get("AdditionalMasterSecurityGroups", [])
+        )
+        security_group_ids.extend(ec2_attributes.get("AdditionalSlaveSecurityGroups", []))
 
-            if "ServiceAccessSecurityGroup" in ec2_attributes.keys():
-                # This one is for a SG that allows acces to private subnets (I don't 100% understand that)
-                security_group_ids.append(ec2_attributes["ServiceAccessSecurityGroup"])
+        ##A cluster can name the same group under several of the fields
+        ##above; dedupe so it isn't indexed twice for one group
+        return list(dict.fromkeys(security_group_ids))
 
-            # These two may contain many security groups
-            if "AdditionalMasterSecurityGroups" in ec2_attributes.keys():
-                security_group_ids.extend(
-                    ec2_attributes["AdditionalMasterSecurityGroups"]
-                )
-            if "AdditionalSlaveSecurityGroups" in ec2_attributes.keys():
-                security_group_ids.extend(
-                    ec2_attributes["AdditionalSlaveSecurityGroups"]
-                )
 
-            for security_group_id in security_group_ids:
-                if security_group_id not in cls._services_by_security_group_id.keys():
-                    cls._services_by_security_group_id[security_group_id] = [cluster]
-                else:
-                    cls._services_by_security_group_id[security_group_id].append(
-                        cluster
-                    )
+def prime(service_types: set, region: str = None) -> None:
+    """Sets clients for the given regional service types and loads the
+    caches of the non-lookupable ones concurrently.
 
-        return
+    Each load_services call is one or more blocking round-trips to a
+    different AWS endpoint, so running them on a thread pool collapses
+    the per-service latencies into roughly the slowest one. boto3
+    client calls are thread-safe.
 
-    @classmethod
-    def get_service_names_in_security_group(cls, security_group: dict) -> list[str]:
-        services = cls.get_services_in_security_group(security_group)
+    Args:
+        service_types (set):    RegionalService types to prepare
+
+        region (str, optional): region to set clients for first.
+                                Defaults to None, leaving clients as-is.
+    """
 
-        service_names = [service["Name"] for service in services]
+    for service_type in service_types:
+        if region is not None:
+            service_type.set_client(region)
 
-        return service_names
+    load_calls = [
+        functools.partial(service_type.ensure_services_loaded, region)
+        for service_type in service_types
+        if issubclass(service_type, NonLookupableRegionalService)
+        and not service_type.has_services(region)
+    ]
+
+    ##EC2 isn't non-lookupable but its instance index loads lazily too;
+    ##filling it here keeps the per-security-group workers to pure dict
+    ##reads instead of racing 32 copies of the same region sweep
+    if EC2 in service_types and not EC2._instances_loaded:
+        load_calls.append(EC2.load_instances)
+
+    if len(load_calls) == 0:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(8, len(load_calls))) as executor:
+        list(executor.map(lambda load_call: load_call(), load_calls))
+
+    return
+
+
+##Service types owning a network interface, keyed by the marker their
+##Description carries. The markers are compiled into one alternation so
+##classification is a single C-level scan per description instead of
+##one search per marker.
+##Defined down here because the map refers to the service classes.
+_service_types_by_description_marker = {
+    "arn:aws:ecs": ECS,
+    "ELB app": ALB,
+    "RDSNetworkInterface": RDS,
+    "DMSNetworkInterface": DMS,
+    "RedshiftNetworkInterface": Redshift,
+    "ElastiCache": ElastiCache,
+}
+
+_description_marker_pattern = re.compile(
+    "|".join(
+        re.escape(marker) for marker in _service_types_by_description_marker
+    )
+)